@@ -5,7 +5,9 @@ Scrapes Amazon product prices using Selenium and notifies users of significant d
 Data is saved locally and synced with a Google Sheet.
 
 Features:
+- Fast HTTP scraping with a Chrome fallback when Amazon blocks requests
 - Persistent Chrome profile using undetected_chromedriver
+- Concurrent scraping of all search items
 - Google Sheets API integration for cloud sync
 - Alertzy notifications for price drops
 - Supports product search customization
@@ -17,25 +19,40 @@ Features:
 # ----------------------------------------
 
 import os
-import json
+import argparse
+import asyncio
+import logging
 import shutil
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import count
+from logging.handlers import RotatingFileHandler
+from dataclasses import dataclass
+from datetime import date
 from time import sleep, time
-from random import randint
+from random import uniform
 from pathlib import Path
+from urllib.parse import quote_plus
 
+import diskcache
+import httpx
+import orjson
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
-from undetected_chromedriver import Chrome, ChromeOptions
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException
+from selectolax.parser import HTMLParser
 
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 
 # ----------------------------------------
 # Constants and Configuration
@@ -43,81 +60,166 @@ from googleapiclient.discovery import build
 
 load_dotenv(".env")
 
-# Environment variables
-ALERTZY_ACCOUNT_KEY  = os.getenv("ALERTZY_ACCOUNT_KEY", "")
-CHROME_DATA_DIR      = Path(os.getenv("CHROME_DATA_DIR", ""))
-CHROME_PROFILE       = Path(os.getenv("CHROME_PROFILE", ""))
-SPREADSHEET_ID       = os.getenv("SPREADSHEET_ID", "")
-HEADLESS             = os.getenv("HEADLESS", "false").lower()
+logger = logging.getLogger(__name__)
+
 ALERTZY_URL          = "https://alertzy.app/send"
+SEARCH_URL           = "https://www.amazon.com/s"
 WAIT_TIME            = 20
-PERCENTAGE_THRESHOLD = input("Enter the percentage dropdown you want to recieve notifications for: ")
-try: PERCENTAGE_THRESHOLD = float(PERCENTAGE_THRESHOLD)
-except: PERCENTAGE_THRESHOLD = 10
-
-# Exit if required env vars are missing
-if not ALERTZY_ACCOUNT_KEY or not CHROME_DATA_DIR or not CHROME_PROFILE or not SPREADSHEET_ID or not os.path.exists("service_account.json"):
-    if not ALERTZY_ACCOUNT_KEY:                    print("❌ Alertzy Account Key is not set. Set it inside the .env file.")
-    if not CHROME_DATA_DIR:                        print("❌ Chrome Data Directory is not set. Set it inside the .env file.")
-    if not CHROME_PROFILE:                         print("❌ Chrome Profile is not set. Set it inside the .env file.")
-    if not SPREADSHEET_ID:                         print("❌ Spreadsheet ID is not set. Set it inside the .env file.")
-    if not os.path.exists("service_account.json"): print("❌ Service Account JSON file not found. Create 'service_account.json' first and place it in the directory.")
-    sys.exit("❌ Exiting... Please fix your environment setup.")
+MAX_WORKERS          = 4
+PAGES_PER_ITEM       = 3
+HTTP_CONCURRENCY     = 8
+HTTP_HEADERS         = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+BLOCKED_URLS         = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.css",
+                        "*.woff", "*.woff2", "*.ttf", "*.mp4", "*amazon-adsystem.com*"]
+RETRY_STATUSES       = (429, 500, 502, 503, 504)
+CAPTCHA_MARKERS      = ("validateCaptcha", "api-services-support@amazon.com", "<title>Robot Check</title>")
+DIVIDER              = "-" * 40
+WORKER_DATA_DIR      = Path(".chrome_workers")
+
+# Locators, shared by Selenium, the in-page extraction script and the HTML parser
+SEL_PRODUCT     = (By.CSS_SELECTOR, 'div[data-component-type="s-search-result"]')
+SEL_TITLE       = (By.CSS_SELECTOR, 'h2')
+SEL_PRICE_WHOLE = (By.CSS_SELECTOR, '.a-price-whole')
+SEL_PRICE_FRAC  = (By.CSS_SELECTOR, '.a-price-fraction')
+SEL_NEXT        = (By.CSS_SELECTOR, 'a.s-pagination-next')
+SEL_SEARCH      = (By.CSS_SELECTOR, 'input#twotabsearchtextbox, input[placeholder*="Search Amazon"], input[aria-label*="Search"], input[id*="nav-bb-search"]')
+
+@dataclass(slots=True, frozen=True)
+class Config:
+    """Settings read once at startup from the environment and the user."""
+    alertzy_key: str
+    data_dir: Path
+    profile: Path
+    spreadsheet_id: str
+    headless: bool
+    threshold: float
+    cache_ttl: int
+
+def load_config():
+    """
+    Reads settings from the environment and asks for the drop threshold.
+    Exits if required settings are missing.
+
+    Returns:
+        Config: Loaded settings.
+    """
+    alertzy_key    = os.getenv("ALERTZY_ACCOUNT_KEY", "")
+    data_dir       = os.getenv("CHROME_DATA_DIR", "")
+    profile        = os.getenv("CHROME_PROFILE", "")
+    spreadsheet_id = os.getenv("SPREADSHEET_ID", "")
+
+    # Exit if required env vars are missing
+    if not alertzy_key or not data_dir or not profile or not spreadsheet_id or not os.path.exists("service_account.json"):
+        if not alertzy_key:                            print("❌ Alertzy Account Key is not set. Set it inside the .env file.")
+        if not data_dir:                               print("❌ Chrome Data Directory is not set. Set it inside the .env file.")
+        if not profile:                                print("❌ Chrome Profile is not set. Set it inside the .env file.")
+        if not spreadsheet_id:                         print("❌ Spreadsheet ID is not set. Set it inside the .env file.")
+        if not os.path.exists("service_account.json"): print("❌ Service Account JSON file not found. Create 'service_account.json' first and place it in the directory.")
+        sys.exit("❌ Exiting... Please fix your environment setup.")
+
+    threshold = input("Enter the percentage dropdown you want to recieve notifications for: ")
+    try: threshold = float(threshold)
+    except: threshold = 10
+
+    try: cache_ttl = int(os.getenv("SERP_CACHE_TTL", 60 * 60))
+    except ValueError: cache_ttl = 60 * 60
+
+    return Config(
+        alertzy_key=alertzy_key,
+        data_dir=Path(data_dir),
+        profile=Path(profile),
+        spreadsheet_id=spreadsheet_id,
+        headless=os.getenv("HEADLESS", "false").lower() == "true",
+        threshold=threshold,
+        cache_ttl=cache_ttl
+    )
+
+CFG = None  # set by load_config() when the script starts
 
 # ----------------------------------------
 # Utilities
 # ----------------------------------------
 
+def parse_args():
+    """Parses command line options."""
+    parser = argparse.ArgumentParser(description="Amazon Price Tracker Bot")
+    parser.add_argument("--no-cache", action="store_true", help="scrape every item again, ignoring recently cached pages and results")
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument("-v", "--verbose", action="store_true", help="log every scraped product")
+    verbosity.add_argument("-q", "--quiet", action="store_true", help="only log warnings and errors")
+    parser.add_argument("--log-file", help="write the log to this file (rotated at 5 MB) instead of the console")
+    return parser.parse_args()
+
 def initialize_project():
     """Create necessary folders and initialize `items.json` if not present."""
     os.makedirs("old", exist_ok=True)
     os.makedirs("new", exist_ok=True)
     if not os.path.exists("items.json"):
-        with open("items.json", "w") as f:
-            json.dump([], f, indent=4)
+        Path("items.json").write_bytes(orjson.dumps([], option=orjson.OPT_INDENT_2))
+
+def file_tag(item):
+    """Returns a file-name-safe tag for a search term."""
+    return item.replace(" ", "_")[:100]
 
-def find_text(parent, by, value):
+def snapshot_path(item):
+    """Returns the path of an item's latest results, used for price comparison."""
+    return f"old/{file_tag(item)}.parquet"
+
+def recent_results(item):
     """
-    Extracts text from an element, returning 'N/A' if not found.
+    Returns the results saved for an item if they are newer than the
+    cache TTL, so a rerun can skip scraping it again.
 
     Args:
-        parent (WebElement): Parent element.
-        by (By): Locator strategy.
-        value (str): Locator value.
+        item (str): Search term.
 
     Returns:
-        str: Extracted text or 'N/A'.
+        pd.DataFrame | None: Saved results, or None if missing or stale.
     """
-    try:
-        return parent.find_element(by, value).text.strip()
-    except NoSuchElementException:
-        return "N/A"
-    except Exception as e:
-        print(f"❌ Error in find_text function: {e}")
-        print("-" * 40)
-        return "N/A"
+    path = snapshot_path(item)
+    if os.path.exists(path) and time() - os.path.getmtime(path) < CFG.cache_ttl:
+        return pd.read_parquet(path)
+    return None
+
+def fast_to_xlsx(df, path):
+    """
+    Writes a DataFrame to an Excel file using xlsxwriter, which is faster
+    than openpyxl for new files.
+
+    Args:
+        df (pd.DataFrame): Data to write.
+        path (str): Output file path.
+    """
+    # Not constant_memory mode: to_excel writes column by column, which that mode would silently truncate
+    with pd.ExcelWriter(path, engine="xlsxwriter") as writer:
+        df.to_excel(writer, index=False)
 
 def create_new_profile():
     """
     Initializes a new Chrome user profile for Amazon.
     Requires user to manually accept cookies on Amazon.
     """
-    profile_path = CHROME_DATA_DIR / CHROME_PROFILE
+    profile_path = CFG.data_dir / CFG.profile
 
-    if not CHROME_DATA_DIR.exists():
-        CHROME_DATA_DIR.mkdir(parents=True)
+    if not CFG.data_dir.exists():
+        CFG.data_dir.mkdir(parents=True)
 
     if profile_path.exists():
         shutil.rmtree(profile_path)
 
-    print(f"🔐 Creating Chrome profile: {CHROME_PROFILE}")
+    print(f"🔐 Creating Chrome profile: {CFG.profile}")
     print("🥇 Log into your Google account.")
     print("🥈 Visit Amazon and accept cookies. (optional)")
     print("🥉 Close browser once done.\n")
 
+    from undetected_chromedriver import Chrome, ChromeOptions
+
     options = ChromeOptions()
-    options.add_argument(f"--user-data-dir={CHROME_DATA_DIR}")
-    options.add_argument(f"--profile-directory={CHROME_PROFILE}")
+    options.add_argument(f"--user-data-dir={CFG.data_dir}")
+    options.add_argument(f"--profile-directory={CFG.profile}")
     driver = Chrome(options=options)
 
     try:
@@ -128,44 +230,292 @@ def create_new_profile():
         driver.quit()
         print("✅ Chrome profile setup completed.")
 
+# Chrome locks a user data directory to one process, so each worker thread
+# scrapes with its own copy of the profile, kept under WORKER_DATA_DIR for the run.
+_worker = threading.local()
+_worker_ids = count(1)
+
+def worker_data_dir():
+    """
+    Returns the user data directory for the current worker thread,
+    copying the base Chrome profile into it on first use.
+
+    Returns:
+        Path: Worker's Chrome user data directory.
+    """
+    if not hasattr(_worker, "data_dir"):
+        data_dir = WORKER_DATA_DIR / f"worker_{next(_worker_ids)}"
+        shutil.copytree(
+            CFG.data_dir / CFG.profile,
+            data_dir / CFG.profile,
+            ignore=shutil.ignore_patterns("Singleton*", "lockfile", "*Cache*"),
+            dirs_exist_ok=True
+        )
+        # Cookies are encrypted with a key stored in 'Local State'
+        local_state = CFG.data_dir / "Local State"
+        if local_state.exists():
+            shutil.copy2(local_state, data_dir / "Local State")
+        _worker.data_dir = data_dir
+    return _worker.data_dir
+
+_drivers = []
+
+# undetected_chromedriver re-patches one shared chromedriver binary on every
+# launch, so concurrent launches would race on that file
+_chrome_launch_lock = threading.Lock()
+
+def worker_driver():
+    """
+    Returns the Chrome session of the current worker thread, launching it
+    on first use so it is reused for every item the worker scrapes.
+
+    Returns:
+        tuple: (Chrome, WebDriverWait) for the worker.
+    """
+    if not hasattr(_worker, "driver"):
+        # Imported on first use so runs that never hit the fallback skip its slow import
+        from undetected_chromedriver import Chrome, ChromeOptions
+
+        options = ChromeOptions()
+        options.add_argument(f"--user-data-dir={worker_data_dir()}")
+        options.add_argument(f"--profile-directory={CFG.profile}")
+        if CFG.headless:
+            options.add_argument("--headless=new")
+        # Only text is scraped, so skip downloading images, stylesheets and fonts
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--no-sandbox")
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        # Don't block on trackers and beacons; wait_and_stop() waits for what we need
+        options.page_load_strategy = "none"
+        with _chrome_launch_lock:
+            driver = Chrome(options=options)
+        # Registered right away so main() quits it even if the setup below fails
+        _drivers.append(driver)
+        # Drop static assets and ad requests before they leave the browser
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+        _worker.wait = WebDriverWait(driver, WAIT_TIME)
+        _worker.driver = driver
+    return _worker.driver, _worker.wait
+
 # ----------------------------------------
 # Scraping Functions
 # ----------------------------------------
 
-def scrap_products(wait, title_lst, price_lst, asin_lst):
+def wait_and_stop(wait, driver, locator):
+    """
+    Waits for elements matching the locator and for the document to be parsed,
+    then stops the page from loading any remaining resources.
+
+    Args:
+        wait (WebDriverWait): Selenium wait instance.
+        driver (Chrome): Browser session.
+        locator (tuple): (By, value) locator of the elements to wait for.
+
+    Returns:
+        list: Matching elements.
+    """
+    wait.until(EC.presence_of_all_elements_located(locator))
+    wait.until(lambda d: d.execute_script("return document.readyState") != "loading")
+    driver.execute_script("window.stop();")
+    return driver.find_elements(*locator)
+
+def scrap_products(driver, wait, title_lst, price_lst, asin_lst):
     """
     Scrapes products from current Amazon search results page.
 
     Args:
+        driver (Chrome): Browser session.
         wait (WebDriverWait): Selenium wait instance.
         title_lst (list): Output list for product titles.
         price_lst (list): Output list for prices.
         asin_lst (list): Output list for ASINs.
     """
-    product_selector = '//div[@data-component-type="s-search-result"]'
-    products = wait.until(EC.presence_of_all_elements_located((By.XPATH, product_selector)))
+    wait_and_stop(wait, driver, SEL_PRODUCT)
+
+    # Extract every product in one round-trip instead of one per field.
+    # textContent matches the HTML parser's output and, unlike innerText, doesn't force a layout.
+    products = driver.execute_script("""
+        const [product, title, whole, fraction] = arguments;
+        const text = (p, selector) => ((p.querySelector(selector) || {}).textContent || '').trim();
+        return Array.from(document.querySelectorAll(product)).map(p => ({
+            asin: p.getAttribute('data-asin'),
+            title: text(p, title),
+            whole: text(p, whole),
+            fraction: text(p, fraction)
+        }));
+    """, SEL_PRODUCT[1], SEL_TITLE[1], SEL_PRICE_WHOLE[1], SEL_PRICE_FRAC[1])
+
+    add_products(products, title_lst, price_lst, asin_lst)
+
+def add_products(products, title_lst, price_lst, asin_lst):
+    """
+    Parses raw product fields and appends the priced ones to the output lists.
+
+    Args:
+        products (list): Dicts with 'title', 'whole', 'fraction' and 'asin' text.
+        title_lst (list): Output list for product titles.
+        price_lst (list): Output list for prices.
+        asin_lst (list): Output list for ASINs.
+    """
+    if not products:
+        return
+    start = len(asin_lst)
+
+    # Parse every price on the page in one vectorized pass
+    raw = pd.DataFrame(products)
+    whole = raw["whole"].str.replace(",", "").str.strip().str.rstrip(".")
+    fraction = raw["fraction"].str.strip().replace("", "00")
+    prices = pd.to_numeric(whole.where(whole != "") + "." + fraction, errors="coerce")
+    priced = prices.notna().values
+    skipped = len(raw) - int(priced.sum())
+
+    title_lst.extend(raw["title"].str.strip().values[priced].tolist())
+    price_lst.extend(prices.values[priced].tolist())
+    asin_lst.extend(raw["asin"].values[priced].tolist())
+
+    # One record per page instead of one per product
+    if logger.isEnabledFor(logging.DEBUG):
+        lines = [f"🛒 {title}\n💲 {price}\n🔗 ASIN: {asin}\n{DIVIDER}"
+                 for title, price, asin in zip(title_lst[start:], price_lst[start:], asin_lst[start:])]
+        if skipped:
+            lines.append(f"⚠️ Skipped {skipped} products with no price\n{DIVIDER}")
+        if lines:
+            logger.debug("\n".join(lines))
+
+@lru_cache(maxsize=1)
+def serp_cache():
+    """Opens the cache of recently scraped search result pages, shared by all workers."""
+    return diskcache.Cache(".serp_cache")
+
+def serp_cache_key(item, page):
+    """Cache key for a search result page, valid for the current day."""
+    return f"{item}|{page}|{date.today():%Y%m%d}"
+
+def parse_search_html(html, title_lst, price_lst, asin_lst):
+    """
+    Scrapes products from the HTML of an Amazon search results page.
 
-    for product in products:
-        title = find_text(product, By.TAG_NAME, 'h2')
-        price_whole = find_text(product, By.CLASS_NAME, 'a-price-whole').replace(",", "")
-        price_fraction = find_text(product, By.CLASS_NAME, 'a-price-fraction')
+    Args:
+        html (str): Page source.
+        title_lst (list): Output list for product titles.
+        price_lst (list): Output list for prices.
+        asin_lst (list): Output list for ASINs.
+    """
+    def text(node, selector):
+        match = node.css_first(selector)
+        return match.text() if match else ""
+
+    products = [{
+        "asin": node.attributes.get("data-asin"),
+        "title": text(node, SEL_TITLE[1]),
+        "whole": text(node, SEL_PRICE_WHOLE[1]),
+        "fraction": text(node, SEL_PRICE_FRAC[1]),
+    } for node in HTMLParser(html).css(SEL_PRODUCT[1])]
+    add_products(products, title_lst, price_lst, asin_lst)
+
+# Amazon cookies from the Chrome fallback, sent with later HTTP searches (only updated on the event loop)
+http_cookies = {}
+
+async def fetch_search_pages(client, semaphore, item, use_cache=True):
+    """
+    Fetches the search result pages for an item concurrently over HTTP,
+    serving recently scraped pages from the cache.
 
-        if price_whole == "N/A":
-            print("⚠️ Skipping product with no price")
-            print("-" * 40)
-            continue
+    Args:
+        client (httpx.AsyncClient): Client shared by all items.
+        semaphore (asyncio.Semaphore): Limits requests in flight across items.
+        item (str): Search term.
+        use_cache (bool): Read and store pages in the search page cache.
 
-        price = float(f"{price_whole}.{price_fraction if price_fraction != 'N/A' else '00'}")
-        asin = product.get_attribute("data-asin")
+    Returns:
+        list | None: HTML of each page, or None if Amazon blocked the request.
+    """
+    pages = {page: serp_cache().get(serp_cache_key(item, page)) if use_cache else None
+             for page in range(1, PAGES_PER_ITEM + 1)}
+    missing = [page for page, html in pages.items() if html is None]
+
+    async def fetch(page):
+        async with semaphore:
+            return await client.get(SEARCH_URL, params={"k": item, "page": page})
+
+    responses = await asyncio.gather(*(fetch(page) for page in missing))
+    for page, response in zip(missing, responses):
+        if response.status_code == 503 or any(marker in response.text for marker in CAPTCHA_MARKERS):
+            return None
+        response.raise_for_status()
+        pages[page] = response.text
+        if use_cache:
+            serp_cache().set(serp_cache_key(item, page), response.text, expire=CFG.cache_ttl)
 
-        title_lst.append(title)
-        price_lst.append(price)
-        asin_lst.append(asin)
+    return list(pages.values())
 
-        print(f"🛒 {title}")
-        print(f"💲 {price}")
-        print(f"🔗 ASIN: {asin}")
-        print("-" * 40)
+def scrape_with_browser(item, title_lst, price_lst, asin_lst, use_cache=True):
+    """
+    Scrapes the search result pages for an item through the worker's Chrome
+    session. Used when Amazon blocks plain HTTP requests.
+
+    Args:
+        item (str): Search term.
+        title_lst (list): Output list for product titles.
+        price_lst (list): Output list for prices.
+        asin_lst (list): Output list for ASINs.
+        use_cache (bool): Store the scraped pages in the search page cache.
+
+    Returns:
+        dict: Amazon cookies of the Chrome session.
+    """
+    driver, wait = worker_driver()
+
+    try:
+        driver.get(f"{SEARCH_URL}?k={quote_plus(item)}")
+        wait_and_stop(wait, driver, SEL_PRODUCT)
+    except Exception as e:
+        # Recover through the home page search box instead of relaunching Chrome
+        logger.warning(f"⚠️ Direct search failed for '{item}', retrying from the home page: {e}")
+        driver.get("https://www.amazon.com/")
+        search_box = wait_and_stop(wait, driver, SEL_SEARCH)[0]
+        search_box.send_keys(item + Keys.ENTER)
+
+    for page in range(1, PAGES_PER_ITEM + 1):
+        scrap_products(driver, wait, title_lst, price_lst, asin_lst)
+        if use_cache:
+            serp_cache().set(serp_cache_key(item, page), driver.page_source, expire=CFG.cache_ttl)
+        if page == PAGES_PER_ITEM:
+            break
+        # The page is fully parsed by now, so a missing link means the last page
+        next_buttons = driver.find_elements(*SEL_NEXT)
+        if not next_buttons:
+            logger.info(f"🛑 No more pages for '{item}'\n{DIVIDER}")
+            break
+        try:
+            next_button = next_buttons[0]
+            first_product = driver.find_element(*SEL_PRODUCT)
+            sleep(uniform(0.2, 0.8))  # small human-like pause before paginating
+            next_button.click()
+            # The old results are detached once the next page starts rendering
+            wait.until(EC.staleness_of(first_product))
+        except Exception as e:
+            logger.info(f"🛑 Error in pagination: {e}\n{DIVIDER}")
+            break
+
+    return {cookie["name"]: cookie["value"] for cookie in driver.get_cookies()}
+
+# Keep-alive session so alert bursts reuse one connection to Alertzy
+http_session = requests.Session()
+http_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=MAX_WORKERS,
+    max_retries=Retry(total=3, backoff_factor=0.5)
+))
 
 def send_alert(message):
     """
@@ -175,22 +525,42 @@ def send_alert(message):
         message (str): Message to send.
     """
     payload = {
-        "accountKey": ALERTZY_ACCOUNT_KEY,
+        "accountKey": CFG.alertzy_key,
         "title": "Dropage In Prices",
         "message": message,
         "group": "My Amazon Scraper"
     }
 
     try:
-        response = requests.post(ALERTZY_URL, json=payload)
+        response = http_session.post(ALERTZY_URL, json=payload, timeout=10)
         response.raise_for_status()
-        print(f"📲 Notification successfully sent to your Alertzy account due to a price drop of {PERCENTAGE_THRESHOLD}% or more since your last check.")
+        logger.info(f"📲 Notification successfully sent to your Alertzy account due to a price drop of {CFG.threshold}% or more since your last check.")
     except Exception as e:
         error_str = str(e)
-        if ALERTZY_API_KEY in error_str:
-            error_str = error_str.replace(ALERTZY_API_KEY, "[SECRET]")
-        print(f"❌ Failed to send alert: {error_str}")
-        print("-" * 40)
+        if CFG.alertzy_key in error_str:
+            error_str = error_str.replace(CFG.alertzy_key, "[SECRET]")
+        logger.error(f"❌ Failed to send alert: {error_str}\n{DIVIDER}")
+
+@lru_cache(maxsize=1)
+def sheets_service():
+    """Builds the Google Sheets client once and reuses it for every upload."""
+    creds = service_account.Credentials.from_service_account_file(
+        "service_account.json",
+        scopes=["https://www.googleapis.com/auth/spreadsheets"]
+    )
+    return build("sheets", "v4", credentials=creds, cache_discovery=False, static_discovery=True)
+
+@lru_cache(maxsize=1)
+def sheet_ids():
+    """
+    Fetches the spreadsheet's tab names once. The returned map is kept up to
+    date by upload_df_to_gsheet as tabs are replaced.
+
+    Returns:
+        dict: Tab title to sheet ID.
+    """
+    spreadsheet = sheets_service().spreadsheets().get(spreadsheetId=CFG.spreadsheet_id).execute()
+    return {sheet['properties']['title']: sheet['properties']['sheetId'] for sheet in spreadsheet['sheets']}
 
 def upload_df_to_gsheet(df, sheet_name):
     """
@@ -200,151 +570,250 @@ def upload_df_to_gsheet(df, sheet_name):
         df (pd.DataFrame): Data to upload.
         sheet_name (str): Tab name.
     """
+    try:
+        service = sheets_service()
+        ids = sheet_ids()
+    except Exception as e:
+        logger.error(f"❌ Failed to read spreadsheet: {e}\n{DIVIDER}")
+        return
+
+    sheet_added = False
+    refresh_ids = False
+
     for attempt in range(3):
         try:
-            creds = service_account.Credentials.from_service_account_file(
-                "service_account.json",
-                scopes=["https://www.googleapis.com/auth/spreadsheets"]
-            )
-            service = build("sheets", "v4", credentials=creds)
-
-            # Delete existing sheet
-            spreadsheet = service.spreadsheets().get(spreadsheetId=SPREADSHEET_ID).execute()
-            for sheet in spreadsheet['sheets']:
-                if sheet['properties']['title'] == sheet_name:
-                    sheet_id = sheet['properties']['sheetId']
-                    service.spreadsheets().batchUpdate(
-                        spreadsheetId=SPREADSHEET_ID,
-                        body={"requests": [{"deleteSheet": {"sheetId": sheet_id}}]}
-                    ).execute()
-                    break
-
-            # Add new sheet
-            service.spreadsheets().batchUpdate(
-                spreadsheetId=SPREADSHEET_ID,
-                body={"requests": [{"addSheet": {"properties": {"title": sheet_name}}}]}
-            ).execute()
+            if refresh_ids:
+                sheet_ids.cache_clear()
+                ids = sheet_ids()
+                refresh_ids = False
+
+            # Replace existing sheet in a single request
+            if not sheet_added:
+                requests_body = []
+                if sheet_name in ids:
+                    requests_body.append({"deleteSheet": {"sheetId": ids[sheet_name]}})
+                requests_body.append({"addSheet": {"properties": {"title": sheet_name}}})
+                response = service.spreadsheets().batchUpdate(
+                    spreadsheetId=CFG.spreadsheet_id,
+                    body={"requests": requests_body}
+                ).execute()
+                ids[sheet_name] = response['replies'][-1]['addSheet']['properties']['sheetId']
+                sheet_added = True
 
             # Upload values
             values = [df.columns.tolist()] + df.values.tolist()
             service.spreadsheets().values().update(
-                spreadsheetId=SPREADSHEET_ID,
+                spreadsheetId=CFG.spreadsheet_id,
                 range=f"{sheet_name}!A1",
                 valueInputOption="RAW",
                 body={"values": values}
             ).execute()
 
-            print(f"✅ Data uploaded to sheet: {sheet_name}")
+            logger.info(f"✅ Data uploaded to sheet: {sheet_name}")
             return
 
         except Exception as e:
-            print(f"❌ Upload attempt {attempt + 1} failed: {e}")
-            if attempt < 2:
-                print("🔁 Retrying...\n")
-                sleep(2)
+            # A tab added or removed outside this run leaves the cached IDs stale
+            if not sheet_added and isinstance(e, HttpError) and e.resp.status == 400:
+                refresh_ids = True
+            # Other client errors (bad permissions, invalid data) fail the same way every time
+            retryable = refresh_ids or not isinstance(e, HttpError) or e.resp.status in RETRY_STATUSES
+            if attempt < 2 and retryable:
+                delay = 2 ** (attempt + 1)
+                logger.warning(f"❌ Upload attempt {attempt + 1} failed: {e}\n🔁 Retrying in {delay}s...\n")
+                sleep(delay)
             else:
-                print("🛑 Giving up after 3 attempts.")
-    print("-" * 40)
+                logger.error(f"❌ Upload attempt {attempt + 1} failed: {e}\n🛑 Giving up on sheet: {sheet_name}\n{DIVIDER}")
+                return
 
 # ----------------------------------------
 # Main Program
 # ----------------------------------------
 
-def main():
-    """Main scraping and comparison loop."""
+def main(use_cache=True):
+    """
+    Main scraping and comparison loop.
+
+    Args:
+        use_cache (bool): Reuse recently scraped pages and results.
+    """
     initialize_project()
 
-    with open("items.json", "r") as file:
-        items = json.load(file)
+    items = set(orjson.loads(Path("items.json").read_bytes()))
 
     # Allow user to edit product list
     while True:
-        print(f"\n📦 Items to Search: {items}")
+        print(f"\n📦 Items to Search: {sorted(items)}")
         choice = input("Type 'no' to continue, 'add' to add item, 'remove' to remove item: ").lower()
         if choice == "no":
             break
         elif choice == "add":
             item = input("Enter item name: ")
-            if item not in items: items.append(item)
+            items.add(item)
         elif choice == "remove":
             item = input("Enter item name: ")
-            if item in items: items.remove(item)
+            items.discard(item)
         else:
             print("⚠️ Invalid input.")
-    with open("items.json", "w") as file:
-        json.dump(items, file, indent=4)
+    items = sorted(items)
+    Path("items.json").write_bytes(orjson.dumps(items, option=orjson.OPT_INDENT_2))
 
     # Profile setup
-    if not (CHROME_DATA_DIR / CHROME_PROFILE).exists():
+    if not (CFG.data_dir / CFG.profile).exists():
         create_new_profile()
 
-    # Search each item
-    for item in items:
-        driver = None
+    # Search items concurrently; Chrome is only launched for items that get blocked
+    if not items:
+        return
+    try:
+        summaries = asyncio.run(scrape_items(items, use_cache))
+    finally:
+        for driver in _drivers:
+            driver.quit()
+        _drivers.clear()
+        shutil.rmtree(WORKER_DATA_DIR, ignore_errors=True)
+
+    print("\n📊 Summary:")
+    for item, summary in zip(items, summaries):
+        if summary is None:
+            print(f"❌ {item}: failed")
+        else:
+            print(f"✅ {item}: {summary['products']} products, {summary['drops']} price drops")
+
+async def scrape_items(items, use_cache=True):
+    """
+    Scrapes all items concurrently over one shared HTTP client. Blocking
+    work (Chrome fallback, file writes, alerts) runs on up to MAX_WORKERS
+    threads, which also caps the number of Chrome sessions; uploads run one
+    at a time on a separate thread, which stays within the Sheets API quota
+    and never holds up a scraping worker.
+
+    Args:
+        items (list): Search terms.
+        use_cache (bool): Reuse recently scraped pages and results.
+
+    Returns:
+        list: Summary of each item, in the same order.
+    """
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=MAX_WORKERS))
+    semaphore = asyncio.Semaphore(HTTP_CONCURRENCY)
+    async with httpx.AsyncClient(http2=True, headers=HTTP_HEADERS, cookies=http_cookies, timeout=WAIT_TIME,
+                                 follow_redirects=True, limits=httpx.Limits(max_connections=4)) as client:
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="sheets") as sheets_executor:
+            return await asyncio.gather(*(scrape_item(client, semaphore, sheets_executor, item, use_cache)
+                                          for item in items))
+
+async def scrape_item(client, semaphore, sheets_executor, item, use_cache=True):
+    """
+    Scrapes one search term, compares it with the previous run, sends alerts
+    and syncs the results to Google Sheets.
+
+    Args:
+        client (httpx.AsyncClient): Client shared by all items.
+        semaphore (asyncio.Semaphore): Limits requests in flight across items.
+        sheets_executor (ThreadPoolExecutor): Single thread that runs the uploads.
+        item (str): Search term.
+        use_cache (bool): Reuse recently scraped pages and results.
+
+    Returns:
+        dict | None: Product and price drop counts, or None on failure.
+    """
+    try:
+        # Scraped within the cache TTL already (alerts were sent then), so only resync the sheet
+        df = await asyncio.to_thread(recent_results, item) if use_cache else None
+        if df is not None:
+            logger.info(f"♻️ Reusing results for '{item}' saved by an earlier run")
+            await asyncio.get_running_loop().run_in_executor(sheets_executor, upload_df_to_gsheet, df, item)
+            return {"products": len(df), "drops": 0}
+
+        title_lst, price_lst, asin_lst = [], [], []
         try:
-            options = ChromeOptions()
-            options.add_argument(f"--user-data-dir={CHROME_DATA_DIR}")
-            options.add_argument(f"--profile-directory={CHROME_PROFILE}")
-            if HEADLESS == "true":
-                options.add_argument("--headless=new")
-            driver = Chrome(options=options)
-            wait = WebDriverWait(driver, WAIT_TIME)
-
-            driver.get("https://www.amazon.com/")
-            search_selector = '//input[contains(@placeholder, "Search Amazon") or contains(@aria-label, "Search") or contains(@id, "nav-bb-search")]'
-            search_box = wait.until(EC.presence_of_element_located((By.XPATH, search_selector)))
-            search_box.send_keys(item + Keys.ENTER)
-
-            title_lst, price_lst, asin_lst = [], [], []
-            for _ in range(3):  # scrape 3 pages
-                scrap_products(wait, title_lst, price_lst, asin_lst)
-                try:
-                    next_button_selector = '//a[contains(@class, "s-pagination-next")]'
-                    next_button = wait.until(EC.presence_of_element_located((By.XPATH, next_button_selector)))
-                    next_button.click()
-                    sleep(randint(2, 5))
-                except Exception as e:
-                    print(f"🛑 No more pages or error in pagination: {e}")
-                    print("-" * 40)
-                    break
-
-            df = pd.DataFrame({"Title": title_lst, "Price": price_lst, "ASIN": asin_lst})
-            search_tag = item.replace(" ", "_")
-
-            df.to_excel(f"new/{search_tag}.xlsx", index=False, engine="openpyxl")
-
-            # Compare with old prices
-            old_path = f"old/{search_tag}.xlsx"
-            if os.path.exists(old_path):
-                old_df = pd.read_excel(old_path)
-                merged = df.merge(old_df, on="ASIN", suffixes=("_new", "_old"))
-                merged = merged[merged["Price_old"] != 0]
-                merged["Price_Drop_%"] = (merged["Price_new"] - merged["Price_old"]) / merged["Price_old"] * 100
-                drops = merged[merged["Price_Drop_%"] >= PERCENTAGE_THRESHOLD]
-                if not drops.empty:
-                    message = "\n\n\n".join(
-                        f"{row['Title_new']}\nOld: ${row['Price_old']:.2f}\nNew: ${row['Price_new']:.2f}\nASIN: {row['ASIN']}"
-                        for _, row in drops.iterrows())
-                    send_alert(message)
-
-            # Save new data
-            df.to_excel(old_path, index=False, engine="openpyxl")
-            upload_df_to_gsheet(df, item)
-
-            sleep(randint(2, 5))
+            pages = await fetch_search_pages(client, semaphore, item, use_cache)
+        except httpx.HTTPError as e:
+            logger.warning(f"⚠️ HTTP search failed for '{item}': {e}")
+            pages = None
+
+        if pages is not None:
+            for html in pages:
+                parse_search_html(html, title_lst, price_lst, asin_lst)
+        if not asin_lst:
+            logger.warning(f"🤖 HTTP search for '{item}' was blocked or empty, falling back to Chrome.")
+            cookies = await asyncio.to_thread(scrape_with_browser, item, title_lst, price_lst, asin_lst, use_cache)
+            # Let the following HTTP searches reuse the session that got past the block
+            http_cookies.update(cookies)
+            client.cookies.update(cookies)
+
+        df, drops_count = await asyncio.to_thread(save_results, item, title_lst, price_lst, asin_lst)
+        await asyncio.get_running_loop().run_in_executor(sheets_executor, upload_df_to_gsheet, df, item)
+        return {"products": len(asin_lst), "drops": drops_count}
 
-        except Exception as e:
-            print(f"❌ Error while processing '{item}': {e}")
-        finally:
-            if driver: driver.quit()
-            print("-" * 40)
+    except Exception as e:
+        logger.error(f"❌ Error while processing '{item}': {e}\n{DIVIDER}")
+        return None
+
+def save_results(item, title_lst, price_lst, asin_lst):
+    """
+    Saves an item's scraped products and alerts on price drops since the
+    previous run.
+
+    Args:
+        item (str): Search term.
+        title_lst (list): Product titles.
+        price_lst (list): Prices.
+        asin_lst (list): ASINs.
+
+    Returns:
+        tuple: (DataFrame of the results, number of price drops found).
+    """
+    search_tag = file_tag(item)
+    new_path = f"new/{search_tag}.xlsx"
+    old_path = snapshot_path(item)
+    legacy_old_path = f"old/{search_tag}.xlsx"  # written by earlier versions
+
+    df = pd.DataFrame({"Title": title_lst, "Price": price_lst, "ASIN": asin_lst})
+    fast_to_xlsx(df, new_path)
+
+    # Compare with old prices
+    drops_count = 0
+    old_df = None
+    if os.path.exists(old_path):
+        old_df = pd.read_parquet(old_path)
+    elif os.path.exists(legacy_old_path):
+        old_df = pd.read_excel(legacy_old_path)
+    if old_df is not None:
+        old_prices = dict(zip(old_df["ASIN"].values, old_df["Price"].values))
+        drops = []
+        for title, price, asin in zip(title_lst, price_lst, asin_lst):
+            old_price = old_prices.get(asin)
+            if old_price and (old_price - price) / old_price * 100 >= CFG.threshold:
+                drops.append((title, old_price, price, asin))
+        drops_count = len(drops)
+        if drops:
+            message = "\n\n\n".join(
+                f"{title}\nOld: ${old_price:.2f}\nNew: ${new_price:.2f}\nASIN: {asin}"
+                for title, old_price, new_price, asin in drops)
+            send_alert(message)
+
+    # Save new data
+    df.to_parquet(old_path, index=False, compression="zstd")
+    return df, drops_count
 
 # ----------------------------------------
 # Entry Point
 # ----------------------------------------
 
 if __name__ == "__main__":
+    args = parse_args()
+    # Libraries (httpx, urllib3, selenium, ...) only log warnings; the verbosity flags apply to this script
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(message)s",
+        handlers=[RotatingFileHandler(args.log_file, maxBytes=5 * 1024 * 1024, backupCount=3,
+                                      encoding="utf-8", delay=True)] if args.log_file else None
+    )
+    logger.setLevel(logging.DEBUG if args.verbose else logging.WARNING if args.quiet else logging.INFO)
+    CFG = load_config()
     start = time()
-    main()
+    main(use_cache=not args.no_cache)
     end = time()
     print(f"\n⏰ Total Execution Time: {round((end - start) / 60, 2)} minutes")